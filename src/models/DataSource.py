@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class DataSource:
     """Represents a marketing data source (e.g., Google Ads, Facebook Ads)."""
     
@@ -6,7 +6,10 @@ Run with: pytest src/tests/test_validateCampaignData.py -v
 
 import pytest
 from datetime import datetime, timedelta
-from src.functions.validateCampaignData import validate_campaign_data
+from src.functions.validateCampaignData import (
+    validate_campaign_data,
+    validate_campaign_batch,
+)
 
 
 # Test Fixtures - Various campaign data scenarios
@@ -334,6 +337,38 @@ def test_validation_result_structure():
     assert isinstance(result["validated_at"], str)
 
 
+def test_batch_validation_mixed_records(
+    valid_campaign, campaign_missing_required_fields, campaign_impossible_metrics
+):
+    """Test that batch validation flags the same records as the per-record path."""
+    results = validate_campaign_batch(
+        [valid_campaign, campaign_missing_required_fields, campaign_impossible_metrics]
+    )
+
+    assert len(results) == 3
+    assert results[0]["valid"] is True
+    assert results[1]["valid"] is False
+    assert len(results[1]["errors"]) > 0
+    assert results[2]["valid"] is False
+    assert len(results[2]["errors"]) > 0
+
+
+def test_batch_validation_empty_input():
+    """Test that an empty batch returns an empty result list."""
+    assert validate_campaign_batch([]) == []
+
+
+def test_batch_validation_result_structure(valid_campaign):
+    """Test that batch results match the per-record result structure."""
+    result = validate_campaign_batch([valid_campaign])[0]
+
+    assert "valid" in result
+    assert "errors" in result
+    assert "warnings" in result
+    assert result["campaign_id"] == valid_campaign["campaign_id"]
+    assert "validated_at" in result
+
+
 # Additional test cases to implement (optional):
 # - Test invalid date format (e.g., "10/15/2024" instead of "2024-10-15")
 # - Test missing campaign_id